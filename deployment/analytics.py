@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Algo Content Hub - Revenue Analytics
+Exports payment events to Parquet and computes payouts, fees and reconciliation in bulk
+"""
+
+import sys
+import base64
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from algosdk import abi, encoding
+
+from snapshot import app_calls, get_indexer_client, read_snapshot, split_state_key, snapshot_frames
+
+# Payment methods of AlgoContentHub, keyed by ABI selector
+PAYMENT_METHODS = {
+    abi.Method.from_signature(f"{name}(byte[],uint64)void").get_selector(): name
+    for name in ("pay_to_view", "pay_to_own")
+}
+
+EVENTS_SCHEMA = pa.schema([
+    ("round", pa.uint64()),
+    ("round_time", pa.timestamp("s", tz="UTC")),
+    ("method", pa.dictionary(pa.int8(), pa.string())),
+    ("content_id", pa.binary()),
+    ("payer", pa.string()),
+    ("amount", pa.uint64()),
+    ("fee_pct", pa.uint8()),
+])
+
+DEFAULT_BATCH_SIZE = 1_000_000
+DEFAULT_ROW_GROUP_SIZE = 1_000_000
+
+
+def decode_payment_call(txn):
+    """Decode a pay_to_view/pay_to_own app call into (method, content_id, amount)"""
+    args = txn.get("application-transaction", {}).get("application-args", [])
+    if len(args) < 3:
+        return None
+    method = PAYMENT_METHODS.get(base64.b64decode(args[0]))
+    if method is None:
+        return None
+    # ARC4 byte[] is a 2-byte length prefix followed by the data
+    content_arg = base64.b64decode(args[1])
+    content_id = content_arg[2:2 + int.from_bytes(content_arg[:2], "big")]
+    amount = int.from_bytes(base64.b64decode(args[2]), "big")
+    return method, content_id, amount
+
+
+def fee_from_delta(delta):
+    """Return the new platform fee if the state delta sets it, else None"""
+    for entry in delta:
+        field, _ = split_state_key(base64.b64decode(entry["key"]))
+        if field == "platform_fee":
+            return entry["value"].get("uint", 0)
+    return None
+
+
+def export_payment_events(app_id, output_path, min_round=0, fee_pct=None, fee_round=None, client=None,
+                          page_size=1000, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+    """Stream every payment call of the app into a Parquet file
+
+    The fee in effect is tracked from platform_fee state deltas. An export
+    that starts after initialize_platform has no such delta to start from, so
+    it must be seeded with fee_pct. If fee_pct was read at an earlier
+    fee_round (a snapshot), fee changes between that round and min_round are
+    replayed before events are recorded. The file metadata records the app,
+    the first round and the last round the export is complete up to.
+    """
+    if fee_pct is None:
+        if min_round > 0:
+            raise ValueError("An export after round 0 needs the platform fee in effect at min_round")
+        fee_pct = 0
+    if fee_round is not None and fee_round > min_round:
+        raise ValueError(f"Fee round {fee_round} is after min_round {min_round}")
+
+    client = client or get_indexer_client()
+    print(f"📥 Exporting payment events of app {app_id}...")
+    scan_round = min(fee_round + 1, min_round) if fee_round is not None else min_round
+
+    exported = 0
+    last_round = min_round
+    next_page = None
+    columns = {name: [] for name in EVENTS_SCHEMA.names}
+
+    def flush(writer):
+        """Write the buffered events as one row group"""
+        if not columns["round"]:
+            return
+        row_group = dict(columns, round_time=pd.to_datetime(columns["round_time"], unit="s", utc=True))
+        writer.write_table(pa.Table.from_pydict(row_group, schema=EVENTS_SCHEMA))
+        for values in columns.values():
+            values.clear()
+
+    with pq.ParquetWriter(output_path, EVENTS_SCHEMA, compression="zstd") as writer:
+        while True:
+            response = client.search_transactions(
+                application_id=app_id,
+                min_round=scan_round,
+                limit=page_size,
+                next_page=next_page,
+            )
+            transactions = response.get("transactions", [])
+            last_round = max(last_round, response.get("current-round", 0))
+
+            for txn in transactions:
+                for call in app_calls(txn, app_id):
+                    new_fee = fee_from_delta(call.get("global-state-delta", []))
+                    if new_fee is not None:
+                        fee_pct = new_fee
+                    payment = decode_payment_call(call)
+                    if payment is None or txn["confirmed-round"] < min_round:
+                        continue
+                    method, content_id, amount = payment
+                    # Inner transactions carry no round of their own
+                    columns["round"].append(txn["confirmed-round"])
+                    columns["round_time"].append(txn["round-time"])
+                    columns["method"].append(method)
+                    columns["content_id"].append(content_id)
+                    columns["payer"].append(call["sender"])
+                    columns["amount"].append(amount)
+                    columns["fee_pct"].append(fee_pct)
+                    exported += 1
+
+            # Buffer pages into large row groups
+            if len(columns["round"]) >= row_group_size:
+                flush(writer)
+
+            next_page = response.get("next-token")
+            if not transactions or not next_page:
+                break
+
+        flush(writer)
+        writer.add_key_value_metadata({
+            "app_id": str(app_id),
+            "min_round": str(min_round),
+            "last_round": str(last_round),
+        })
+
+    print(f"✅ Exported {exported} payment events to {output_path}")
+    print(f"📍 Rounds {min_round}-{last_round}")
+    return exported
+
+
+def read_events_metadata(events_path):
+    """Return (app_id, min_round, last_round) recorded by export_payment_events"""
+    metadata = pq.ParquetFile(events_path).metadata.metadata or {}
+    return (
+        int(metadata.get(b"app_id", 0)),
+        int(metadata.get(b"min_round", 0)),
+        int(metadata.get(b"last_round", 0)),
+    )
+
+
+def split_fees(amount, fee_pct):
+    """Vectorized fee split matching pay_to_view: (platform_fee, creator_payment)"""
+    amount = np.asarray(amount, dtype=np.uint64)
+    platform_fee = amount * np.asarray(fee_pct, dtype=np.uint64) // np.uint64(100)
+    return platform_fee, amount - platform_fee
+
+
+def _add(total, partial):
+    """Accumulate a partial aggregate into a running total, keeping integer dtypes exact"""
+    if total is None:
+        return partial
+    index = total.index.union(partial.index)
+    return total.reindex(index, fill_value=0) + partial.reindex(index, fill_value=0)
+
+
+def aggregate_payments(events_path, period="D", batch_size=DEFAULT_BATCH_SIZE, max_round=None):
+    """Aggregate payment events in bounded-memory chunks
+
+    Returns per-content, per-payer, per-period and per-method totals of
+    amount, platform fee and creator payment, optionally only up to max_round.
+    """
+    by_content = by_payer = by_period = by_method = None
+    rows = 0
+
+    events = pq.ParquetFile(events_path)
+    for batch in events.iter_batches(batch_size=batch_size):
+        frame = batch.to_pandas()
+        if max_round is not None:
+            frame = frame[frame["round"] <= max_round].copy()
+        frame["platform_fee"], frame["creator_payment"] = split_fees(
+            frame["amount"].to_numpy(), frame["fee_pct"].to_numpy()
+        )
+        totals = frame[["amount", "platform_fee", "creator_payment"]]
+        period_key = frame["round_time"].dt.tz_localize(None).dt.to_period(period)
+
+        by_content = _add(by_content, totals.groupby(frame["content_id"], sort=False).sum())
+        by_payer = _add(by_payer, frame.groupby("payer", sort=False)["amount"].sum())
+        by_period = _add(by_period, totals.groupby(period_key, sort=False).sum())
+        by_method = _add(by_method, totals.groupby(frame["method"].astype(str), sort=False).sum())
+        rows += len(frame)
+
+    if rows == 0:
+        empty = pd.DataFrame(columns=["amount", "platform_fee", "creator_payment"], dtype="uint64")
+        return {"rows": 0, "content": empty, "payer": pd.Series(dtype="uint64"),
+                "period": empty, "method": empty}
+
+    return {
+        "rows": rows,
+        "content": by_content.astype("uint64"),
+        "payer": by_payer.astype("uint64"),
+        "period": by_period.astype("uint64").sort_index(),
+        "method": by_method.astype("uint64"),
+    }
+
+
+def creator_payouts(by_content, content_owners):
+    """Roll per-content totals up to per-creator payouts"""
+    creators = by_content.index.map(content_owners).fillna(b"")
+    payouts = by_content.groupby(creators).sum()
+    payouts.index = [
+        encoding.encode_address(owner) if len(owner) == 32 else owner.decode(errors="replace")
+        for owner in payouts.index
+    ]
+    return payouts.sort_values("creator_payment", ascending=False)
+
+
+def reconcile(aggregates, frames):
+    """Compare event-derived revenue with on-chain totals from a snapshot"""
+    on_chain_fees = int(frames["platform"].get("total_revenue", 0))
+    event_fees = int(aggregates["content"]["platform_fee"].sum())
+
+    on_chain_creator = frames["content"]["creator_revenue"].dropna().astype("uint64")
+    event_creator = aggregates["content"]["creator_payment"]
+    index = on_chain_creator.index.union(event_creator.index)
+    creator = pd.DataFrame({
+        "on_chain": on_chain_creator.reindex(index, fill_value=0),
+        "events": event_creator.reindex(index, fill_value=0),
+    })
+    creator["difference"] = creator["events"].astype("int64") - creator["on_chain"].astype("int64")
+
+    return {
+        "platform_fee_on_chain": on_chain_fees,
+        "platform_fee_events": event_fees,
+        "platform_fee_difference": event_fees - on_chain_fees,
+        "creator_mismatches": creator[creator["difference"] != 0],
+    }
+
+
+def print_report(aggregates, payouts=None, reconciliation=None):
+    """Print a revenue report"""
+    print(f"📊 Payment events: {aggregates['rows']}")
+    print(f"💰 Platform fees: {int(aggregates['content']['platform_fee'].sum())} microAlgos")
+    print(f"🎨 Creator payouts: {int(aggregates['content']['creator_payment'].sum())} microAlgos")
+
+    print("\n📅 Revenue per period:")
+    print(aggregates["period"].to_string())
+
+    print("\n🧾 Revenue per method:")
+    print(aggregates["method"].to_string())
+
+    if payouts is not None:
+        print("\n🏆 Top creators:")
+        print(payouts.head(20).to_string())
+
+    if reconciliation is not None:
+        print("\n🔎 Reconciliation against on-chain state:")
+        print(f"   total_revenue on chain: {reconciliation['platform_fee_on_chain']}")
+        print(f"   platform fees in events: {reconciliation['platform_fee_events']}")
+        print(f"   difference: {reconciliation['platform_fee_difference']}")
+        mismatches = reconciliation["creator_mismatches"]
+        if mismatches.empty:
+            print("✅ creator_revenue matches for all content")
+        else:
+            print(f"❌ creator_revenue mismatches: {len(mismatches)}")
+            print(mismatches.head(20).to_string())
+
+
+def main():
+    """Analytics entry point"""
+    parser = argparse.ArgumentParser(description="Algo Content Hub revenue analytics")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = commands.add_parser("export", help="Export payment events to Parquet")
+    export_cmd.add_argument("app_id", type=int)
+    export_cmd.add_argument("output")
+    export_cmd.add_argument("--min-round", type=int, default=0)
+    export_cmd.add_argument("--fee", type=int, default=None, help="Platform fee in effect at --min-round")
+    export_cmd.add_argument("--snapshot", help="Take the platform fee at --min-round from this snapshot")
+
+    report_cmd = commands.add_parser("report", help="Compute revenue report from exported events")
+    report_cmd.add_argument("events")
+    report_cmd.add_argument("--snapshot", help="State snapshot for creators and reconciliation")
+    report_cmd.add_argument("--period", default="D", help="Pandas period alias, e.g. D, W, M")
+    report_cmd.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    args = parser.parse_args()
+
+    print("🎬 Algo Content Hub - Revenue Analytics")
+    print("=" * 50)
+
+    if args.command == "export":
+        fee_pct, fee_round = args.fee, None
+        if fee_pct is None and args.snapshot:
+            snapshot_app_id, fee_round, _ = read_snapshot(args.snapshot)
+            if snapshot_app_id != args.app_id:
+                print(f"❌ Snapshot is for app {snapshot_app_id}, not app {args.app_id}")
+                sys.exit(1)
+            if fee_round > args.min_round:
+                print(f"❌ Snapshot round {fee_round} is after --min-round {args.min_round}")
+                sys.exit(1)
+            fee_pct = int(snapshot_frames(args.snapshot)["platform"].get("platform_fee", 0))
+        if fee_pct is None and args.min_round > 0:
+            print("❌ --min-round needs --fee or a --snapshot taken at or before it")
+            sys.exit(1)
+        export_payment_events(args.app_id, args.output, args.min_round, fee_pct, fee_round)
+        return
+
+    if not Path(args.events).exists():
+        print(f"❌ Events file not found: {args.events}")
+        sys.exit(1)
+
+    max_round = None
+    if args.snapshot:
+        # Reconciliation needs the full history up to exactly the snapshot round
+        events_app_id, min_round, last_round = read_events_metadata(args.events)
+        snapshot_app_id, snapshot_round, _ = read_snapshot(args.snapshot)
+        if events_app_id != snapshot_app_id:
+            print(f"❌ Events are for app {events_app_id}, snapshot is for app {snapshot_app_id}")
+            sys.exit(1)
+        if min_round > 0:
+            print(f"❌ Events start at round {min_round}, reconciliation needs a full export")
+            sys.exit(1)
+        if last_round < snapshot_round:
+            print(f"❌ Events end at round {last_round}, before snapshot round {snapshot_round}; re-export")
+            sys.exit(1)
+        max_round = snapshot_round
+        print(f"📍 Using events up to snapshot round {snapshot_round}")
+
+    aggregates = aggregate_payments(args.events, args.period, args.batch_size, max_round)
+    payouts = reconciliation = None
+    if args.snapshot:
+        frames = snapshot_frames(args.snapshot)
+        payouts = creator_payouts(aggregates["content"], frames["content"]["content_owners"])
+        reconciliation = reconcile(aggregates, frames)
+
+    print_report(aggregates, payouts, reconciliation)
+
+
+if __name__ == "__main__":
+    main()
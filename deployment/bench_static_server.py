@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Algo Content Hub - Static Server Benchmark
+Compares static_server.py against python -m http.server on the same tree
+"""
+
+import sys
+import time
+import socket
+import asyncio
+import argparse
+import subprocess
+from pathlib import Path
+
+from build_frontend import ROOT_DIR, build_frontend
+
+BROWSER_HEADERS = "Accept-Encoding: br, gzip\r\n"
+
+
+def free_port():
+    """Pick an unused local port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=10):
+    """Block until something listens on the port"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+async def read_response(reader):
+    """Read one response, returning (status, body length, keep-alive)"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    version, status = lines[0].split(" ")[:2]
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    return int(status), len(body), keep_alive
+
+
+async def client(port, paths, deadline, latencies, counters):
+    """Issue requests over one connection, reconnecting when the server closes it"""
+    reader = writer = None
+    i = 0
+    while time.monotonic() < deadline:
+        if writer is None:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        path = paths[i % len(paths)]
+        i += 1
+        request = f"GET /{path} HTTP/1.1\r\nHost: localhost\r\n{BROWSER_HEADERS}\r\n"
+        started = time.perf_counter()
+        writer.write(request.encode())
+        try:
+            status, length, keep_alive = await read_response(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            reader = writer = None
+            counters["errors"] += 1
+            continue
+        latencies.append(time.perf_counter() - started)
+        counters["bytes"] += length
+        if status >= 400:
+            counters["errors"] += 1
+        if not keep_alive:
+            writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def run_load(port, paths, connections, duration):
+    """Run a fixed-duration load test and return its statistics"""
+    latencies = []
+    counters = {"bytes": 0, "errors": 0}
+    deadline = time.monotonic() + duration
+    await asyncio.gather(*(client(port, paths, deadline, latencies, counters) for _ in range(connections)))
+
+    latencies.sort()
+    count = len(latencies)
+    return {
+        "requests": count,
+        "rps": count / duration,
+        "p50_ms": latencies[count // 2] * 1000 if count else 0,
+        "p99_ms": latencies[int(count * 0.99)] * 1000 if count else 0,
+        "mb": counters["bytes"] / 1e6,
+        "errors": counters["errors"],
+    }
+
+
+def benchmark(name, command, root, port, paths, connections, duration):
+    """Start a server process, load it and stop it"""
+    process = subprocess.Popen(command, cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if not wait_for_port(port):
+            print(f"❌ {name} did not start")
+            return None
+        return asyncio.run(run_load(port, paths, connections, duration))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the static server against http.server")
+    parser.add_argument("--root", default=str(ROOT_DIR / "dist"))
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    print("🎬 Algo Content Hub - Static Server Benchmark")
+    print("=" * 50)
+
+    root = Path(args.root)
+    if not (root / "manifest.json").exists():
+        build_frontend(root)
+
+    # A first page load: every HTML page and the assets they reference
+    paths = [path.relative_to(root).as_posix() for path in sorted(root.rglob("*"))
+             if path.is_file() and path.suffix in (".html", ".js", ".css")]
+
+    servers = {
+        "http.server": [sys.executable, "-m", "http.server"],
+        "static_server": [sys.executable, str(Path(__file__).with_name("static_server.py")),
+                          "--root", str(root), "--host", "127.0.0.1", "--workers", str(args.workers)],
+    }
+
+    results = {}
+    for name, command in servers.items():
+        port = free_port()
+        if name == "http.server":
+            command = command + [str(port), "--bind", "127.0.0.1"]
+        else:
+            command = command + ["--port", str(port)]
+        print(f"🔥 {name}: {args.connections} connections for {args.duration}s...")
+        results[name] = benchmark(name, command, root, port, paths, args.connections, args.duration)
+
+    print(f"\n{'server':<15}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'MB':>10}{'errors':>8}")
+    for name, stats in results.items():
+        if stats is None:
+            continue
+        print(f"{name:<15}{stats['rps']:>10.0f}{stats['p50_ms']:>10.2f}"
+              f"{stats['p99_ms']:>10.2f}{stats['mb']:>10.1f}{stats['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
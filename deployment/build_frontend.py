@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Algo Content Hub - Frontend Build
+Merges the frontend sources into one dist tree with minified, hashed and precompressed assets
+"""
+
+import re
+import sys
+import gzip
+import json
+import shutil
+import hashlib
+import argparse
+from fnmatch import fnmatch
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # Brotli variants are optional
+    brotli = None
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Source roots in priority order: frontend/ is canonical, the repo root only
+# contributes pages that frontend/ does not have.
+SOURCE_DIRS = [ROOT_DIR / "frontend", ROOT_DIR]
+SOURCE_PATTERNS = ["*.html", "*.css", "js/*.js"]
+EXCLUDED_PATTERNS = ["test-*.html"]
+
+# Long-lived assets get a content hash in their name, entry pages keep theirs
+HASHED_SUFFIXES = {".js", ".css"}
+COMPRESSED_SUFFIXES = {".html", ".js", ".css", ".json", ".svg"}
+MIN_COMPRESS_SIZE = 256
+
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "no-cache"
+
+# Subdirectory of the output that tenant builds are written to
+TENANTS_DIR = "tenants"
+
+# Platform config values injected into the config object of js/config.js; the
+# network is only injected when the caller picks one, never from the config file
+CONFIG_MODULE = "js/config.js"
+CONFIG_OBJECT = "this.config = {"
+INJECTED_CONFIG_KEYS = [
+    "platformName", "platformVersion", "platformFee", "contractAddress",
+    "platformOwner", "ipfsGateway", "supportedWallets", "features",
+]
+
+_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORDS = {"return", "typeof", "case", "in", "of", "delete", "void", "throw", "new", "else", "do"}
+_HTML_RAW_BLOCKS = re.compile(
+    r"(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2\s*>)", re.IGNORECASE | re.DOTALL
+)
+_HTML_COMMENTS = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_HTML_ASSET_REFS = re.compile(r"""((?:src|href)\s*=\s*["'])([^"'#?]+)(["'])""", re.IGNORECASE)
+
+
+def collect_sources():
+    """Collect source files, keeping one copy of each path and dropping duplicates"""
+    sources = {}
+    for source_dir in SOURCE_DIRS:
+        for pattern in SOURCE_PATTERNS:
+            for path in sorted(source_dir.glob(pattern)):
+                if any(fnmatch(path.name, excluded) for excluded in EXCLUDED_PATTERNS):
+                    continue
+                rel_path = path.relative_to(source_dir).as_posix()
+                if rel_path not in sources:
+                    sources[rel_path] = path
+                elif path.read_bytes() != sources[rel_path].read_bytes():
+                    print(f"⚠️  {path.relative_to(ROOT_DIR)} differs from "
+                          f"{sources[rel_path].relative_to(ROOT_DIR)}, using the latter")
+    return sources
+
+
+def _append_space(out, whitespace):
+    """Append collapsed whitespace, keeping a newline if there was one"""
+    space = "\n" if "\n" in whitespace else " "
+    if out and out[-1] in (" ", "\n"):
+        if space == "\n":
+            out[-1] = "\n"
+        return
+    if out:
+        out.append(space)
+
+
+def _skip_string(source, i):
+    """Return the index after the string or template literal starting at i"""
+    quote = source[i]
+    j = i + 1
+    while j < len(source):
+        ch = source[j]
+        if ch == "\\":
+            j += 2
+            continue
+        if ch == quote:
+            return j + 1
+        if quote == "`" and source.startswith("${", j):
+            j = _skip_template_expression(source, j + 2)
+            continue
+        if ch == "\n" and quote != "`":
+            return j
+        j += 1
+    return len(source)
+
+
+def _skip_template_expression(source, j):
+    """Return the index after the ${...} expression whose body starts at j"""
+    depth = 1
+    while j < len(source):
+        ch = source[j]
+        if ch in "'\"`":
+            j = _skip_string(source, j)
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return j + 1
+        j += 1
+    return len(source)
+
+
+def _skip_regex(source, i):
+    """Return the index after the regex literal starting at i, or None if it is not one"""
+    j = i + 1
+    in_class = False
+    while j < len(source):
+        ch = source[j]
+        if ch == "\\":
+            j += 2
+            continue
+        if ch == "\n":
+            return None
+        if ch == "[":
+            in_class = True
+        elif ch == "]":
+            in_class = False
+        elif ch == "/" and not in_class:
+            j += 1
+            while j < len(source) and source[j].isalpha():
+                j += 1
+            return j
+        j += 1
+    return None
+
+
+def minify_js(source):
+    """Strip comments and indentation from JavaScript
+
+    Newlines are kept so automatic semicolon insertion behaves exactly as in
+    the source; strings, template literals and regex literals are copied verbatim.
+    """
+    out = []
+    last = ""
+    word = ""
+    i = 0
+    n = len(source)
+    while i < n:
+        ch = source[i]
+        if ch in "'\"`":
+            j = _skip_string(source, i)
+            out.append(source[i:j])
+            last, word, i = ch, "", j
+            continue
+        if source.startswith("//", i):
+            j = source.find("\n", i)
+            i = n if j < 0 else j
+            continue
+        if source.startswith("/*", i):
+            j = source.find("*/", i + 2)
+            i = n if j < 0 else j + 2
+            _append_space(out, " ")
+            continue
+        if ch == "/" and (not last or last in _REGEX_PRECEDERS or word in _REGEX_KEYWORDS):
+            j = _skip_regex(source, i)
+            if j is not None:
+                out.append(source[i:j])
+                last, word, i = "/", "", j
+                continue
+        if ch.isspace():
+            j = i
+            while j < n and source[j].isspace():
+                j += 1
+            _append_space(out, source[i:j])
+            i = j
+            continue
+        out.append(ch)
+        word = word + ch if ch.isalnum() or ch in "_$" else ""
+        last = ch
+        i += 1
+    return "".join(out).strip() + "\n"
+
+
+def minify_css(source):
+    """Strip comments and collapse whitespace in CSS"""
+    out = []
+    i = 0
+    n = len(source)
+    while i < n:
+        ch = source[i]
+        if ch in "'\"":
+            j = _skip_string(source, i)
+            out.append(source[i:j])
+            i = j
+            continue
+        if source.startswith("/*", i):
+            j = source.find("*/", i + 2)
+            i = n if j < 0 else j + 2
+            continue
+        if ch.isspace():
+            j = i
+            while j < n and source[j].isspace():
+                j += 1
+            prev = out[-1] if out else "{"
+            nxt = source[j] if j < n else "}"
+            if prev not in "{};,>" and nxt not in "{};,>":
+                out.append(" ")
+            i = j
+            continue
+        if ch == "}" and out and out[-1] == ";":
+            out[-1] = "}"
+        else:
+            out.append(ch)
+        i += 1
+    return "".join(out) + "\n"
+
+
+def minify_html(source):
+    """Strip comments and indentation from HTML, minifying inline scripts and styles"""
+    def minify_text(text):
+        text = _HTML_COMMENTS.sub("", text)
+        lines = (line.strip() for line in text.splitlines())
+        return "\n".join(line for line in lines if line)
+
+    parts = []
+    position = 0
+    for match in _HTML_RAW_BLOCKS.finditer(source):
+        parts.append(minify_text(source[position:match.start()]))
+        opening, tag, body, closing = match.group(1), match.group(2).lower(), match.group(3), match.group(4)
+        if tag == "script" and "src=" not in opening.lower() and body.strip():
+            body = "\n" + minify_js(body)
+        elif tag == "style":
+            body = minify_css(body)
+        parts.append(opening + body + closing)
+        position = match.end()
+    parts.append(minify_text(source[position:]))
+    return "\n".join(part for part in parts if part) + "\n"
+
+
+def _object_literal_end(source, start):
+    """Return the index after the object literal whose opening brace is at start"""
+    depth = 0
+    i = start
+    while i < len(source):
+        ch = source[i]
+        if ch in "'\"`":
+            i = _skip_string(source, i)
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    raise ValueError("Unterminated object literal")
+
+
+def inject_config(text, config, network=None):
+    """Override the defaults of the config object in js/config.js with the platform config"""
+    values = {key: config[key] for key in INJECTED_CONFIG_KEYS if key in config}
+    if values.get("contractAddress") == "TO_BE_DEPLOYED":
+        del values["contractAddress"]
+    if network:
+        values["network"] = network
+
+    start = text.find(CONFIG_OBJECT)
+    if start < 0:
+        print(f"⚠️  No config object found in {CONFIG_MODULE}, config not injected")
+        return text
+    end = _object_literal_end(text, start + len(CONFIG_OBJECT) - 1)
+    if text[end:end + 1] == ";":
+        end += 1
+    override = f"\n        Object.assign(this.config, {json.dumps(values)});"
+    return text[:end] + override + text[end:]
+
+
+def content_hash(data):
+    """Short content hash used in asset file names"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def write_compressed(path, data):
+    """Write gzip and brotli variants next to a file, returning their sizes"""
+    sizes = {}
+    if path.suffix not in COMPRESSED_SUFFIXES or len(data) < MIN_COMPRESS_SIZE:
+        return sizes
+
+    gzipped = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gzipped) < len(data):
+        path.with_name(path.name + ".gz").write_bytes(gzipped)
+        sizes["gzip"] = len(gzipped)
+
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        if len(compressed) < len(data):
+            path.with_name(path.name + ".br").write_bytes(compressed)
+            sizes["br"] = len(compressed)
+    return sizes
+
+
+def build_frontend(output_dir=None, config=None, minify=True, network=None):
+    """Build the frontend into a dist tree and return its manifest"""
+    output_dir = Path(output_dir or ROOT_DIR / "dist")
+    if config is None:
+        config = json.loads((ROOT_DIR / "deployment" / "platform-config.json").read_text())
+
+    print(f"🔨 Building frontend into {output_dir}...")
+    # Tenant builds from --tenants live under the same output, keep them
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for child in output_dir.iterdir():
+        if child.name == TENANTS_DIR:
+            continue
+        if child.is_dir() and not child.is_symlink():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
+
+    sources = collect_sources()
+    minifiers = {".js": minify_js, ".css": minify_css, ".html": minify_html}
+
+    # Assets first so pages can be rewritten to point at their hashed names
+    processed = {}
+    renamed = {}
+    for rel_path, path in sources.items():
+        text = path.read_text(encoding="utf-8")
+        if rel_path == CONFIG_MODULE:
+            text = inject_config(text, config, network)
+        suffix = path.suffix
+        if minify and suffix in minifiers and suffix != ".html":
+            text = minifiers[suffix](text)
+        data = text.encode("utf-8")
+        if suffix in HASHED_SUFFIXES:
+            stem, _, ext = rel_path.rpartition(".")
+            renamed[rel_path] = f"{stem}.{content_hash(data)}.{ext}"
+        processed[rel_path] = data
+
+    def rewrite_reference(match):
+        target = match.group(2)
+        return match.group(1) + renamed.get(target, target) + match.group(3)
+
+    manifest = {"files": {}, "assets": renamed, "config": config}
+    for rel_path, data in processed.items():
+        if rel_path.endswith(".html"):
+            text = _HTML_ASSET_REFS.sub(rewrite_reference, data.decode("utf-8"))
+            data = (minify_html(text) if minify else text).encode("utf-8")
+
+        out_rel_path = renamed.get(rel_path, rel_path)
+        out_path = output_dir / out_rel_path
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_bytes(data)
+
+        source_size = sources[rel_path].stat().st_size
+        entry = {
+            "source": rel_path,
+            "size": len(data),
+            "source_size": source_size,
+            "etag": hashlib.sha256(data).hexdigest()[:32],
+            "cache_control": CACHE_IMMUTABLE if rel_path in renamed else CACHE_REVALIDATE,
+        }
+        entry.update(write_compressed(out_path, data))
+        manifest["files"][out_rel_path] = entry
+
+    (output_dir / "manifest.json").write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+    total_source = sum(entry["source_size"] for entry in manifest["files"].values())
+    total_built = sum(entry["size"] for entry in manifest["files"].values())
+    total_gzip = sum(entry.get("gzip", entry["size"]) for entry in manifest["files"].values())
+    print(f"✅ Built {len(manifest['files'])} files")
+    print(f"📦 Source: {total_source} bytes, minified: {total_built} bytes, gzip: {total_gzip} bytes")
+    if brotli is None:
+        print("⚠️  brotli not installed, skipped .br variants")
+    return manifest
+
+
+def tenant_config(config, tenant):
+    """Platform config of one tenant: shared settings overridden by the tenant's own"""
+    merged = {name: value for name, value in config.items() if name != "tenants"}
+    merged.update(tenant)
+    return merged
+
+
+def build_tenants(output_dir=None, config=None, minify=True, network=None):
+    """Build one dist tree per tenant under output_dir/<tenantId>"""
+    output_dir = Path(output_dir or ROOT_DIR / "dist" / TENANTS_DIR)
+    if config is None:
+        config = json.loads((ROOT_DIR / "deployment" / "platform-config.json").read_text())
+
+    manifests = {}
+    for tenant in config.get("tenants", []):
+        tenant_id = tenant["tenantId"]
+        print(f"🏷️  Tenant {tenant_id}")
+        manifests[tenant_id] = build_frontend(output_dir / tenant_id, tenant_config(config, tenant), minify, network)
+    return manifests
+
+
+def main():
+    """Frontend build entry point"""
+    parser = argparse.ArgumentParser(description="Build the Algo Content Hub frontend")
+    parser.add_argument("--output", default=str(ROOT_DIR / "dist"))
+    parser.add_argument("--config", default=str(ROOT_DIR / "deployment" / "platform-config.json"))
+    parser.add_argument("--contract-address", help="Override contractAddress from the config")
+    parser.add_argument("--network", help="Network the build talks to (default: keep js/config.js's own)")
+    parser.add_argument("--no-minify", action="store_true")
+    parser.add_argument("--tenants", action="store_true", help="Build every tenant into <output>/tenants/")
+    args = parser.parse_args()
+
+    print("🎬 Algo Content Hub - Frontend Build")
+    print("=" * 50)
+
+    config_path = Path(args.config)
+    if not config_path.exists():
+        print(f"❌ Config not found: {config_path}")
+        sys.exit(1)
+    config = json.loads(config_path.read_text())
+    if args.contract_address:
+        config["contractAddress"] = args.contract_address
+
+    if args.tenants:
+        build_tenants(Path(args.output) / TENANTS_DIR, config, not args.no_minify, args.network)
+    else:
+        build_frontend(args.output, config, not args.no_minify, args.network)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,10 @@ import subprocess
 import sys
 from pathlib import Path
 
+from algosdk.logic import get_application_address
+
+from build_frontend import build_frontend, build_tenants
+
 def run_command(command, cwd=None):
     """Run a command and return the result"""
     try:
@@ -92,33 +96,11 @@ def update_frontend_for_mainnet(contract_address, platform_owner):
     """Update frontend configuration for MainNet"""
     print("🔧 Updating frontend for MainNet...")
     
-    # Update smart-contract.js
-    smart_contract_file = Path("frontend/js/smart-contract.js")
-    if smart_contract_file.exists():
-        with open(smart_contract_file, 'r') as f:
-            content = f.read()
-        
-        # Replace contract address
-        content = content.replace('MAINNET_CONTRACT_ADDRESS', contract_address)
-        
-        with open(smart_contract_file, 'w') as f:
-            f.write(content)
-        
-        print("✅ Updated smart-contract.js with MainNet address")
-    
-    # Update app.js
-    app_file = Path("frontend/js/app.js")
-    if app_file.exists():
-        with open(app_file, 'r') as f:
-            content = f.read()
-        
-        # Replace contract address
-        content = content.replace('DEMO_CONTRACT_ADDRESS', contract_address)
-        
-        with open(app_file, 'w') as f:
-            f.write(content)
-        
-        print("✅ Updated app.js with MainNet address")
+    # Build dist/ with the MainNet address injected instead of patching sources
+    config = json.loads(Path("deployment/platform-config.json").read_text())
+    config["contractAddress"] = contract_address
+    config["platformOwner"] = platform_owner
+    build_frontend(config=config, network="mainnet")
     
     # Create MainNet environment file
     env_file = Path("frontend/.env")
@@ -135,6 +117,34 @@ MAINNET=true
     
     print("✅ Created MainNet .env file")
 
+def deploy_tenant_hubs():
+    """Deploy a hub per configured tenant through the factory and build their frontends"""
+    config = json.loads(Path("deployment/platform-config.json").read_text())
+    factory_app_id = str(config.get("factoryAppId", ""))
+    if not config.get("tenants") or not factory_app_id.isdigit():
+        print("ℹ️  No hub factory configured, skipping tenant hubs")
+        return []
+    
+    # Imported here so plain MainNet deploys don't need pyarrow or an indexer
+    from registry import RegistryClient, register_tenants
+    
+    print(f"🏭 Deploying tenant hubs through factory {factory_app_id}...")
+    registry = RegistryClient(int(factory_app_id))
+    tenants = register_tenants(registry, config["tenants"], config)
+    
+    # Build every tenant's frontend in one pass with its own hub address
+    app_ids = {tenant.tenant_id: tenant.app_id for tenant in tenants}
+    for tenant_config in config["tenants"]:
+        app_id = app_ids.get(tenant_config["tenantId"])
+        if app_id:
+            tenant_config["contractAddress"] = get_application_address(app_id)
+        else:
+            print(f"⚠️  {tenant_config['tenantId']} has no hub, its build has no contract address")
+    build_tenants(config=config, network="mainnet")
+    
+    print(f"✅ {len(tenants)} tenant hubs ready")
+    return tenants
+
 def create_mainnet_instructions():
     """Create instructions for MainNet testing"""
     instructions = """
@@ -207,6 +217,9 @@ def main():
     # Update frontend with your wallet address
     update_frontend_for_mainnet(contract_address, '4E7PHGNF7HJDAVKWQMOLH3WGTN2UL3O2OYSRNB26KXLADVCOHRM6HGQPXA')
     
+    # Deploy tenant hubs
+    tenants = deploy_tenant_hubs()
+    
     # Create instructions
     create_mainnet_instructions()
     
@@ -216,9 +229,11 @@ def main():
     print(f"💰 Platform Fee: 5% (real ALGO)")
     print(f"🏦 Platform Owner: 4E7PHGNF7HJDAVKWQMOLH3WGTN2UL3O2OYSRNB26KXLADVCOHRM6HGQPXA")
     print(f"📱 QR Code: Ready for Pera Wallet connection")
+    for tenant in tenants:
+        print(f"🏷️  Tenant {tenant.tenant_id}: app {tenant.app_id}")
     
     print("\n📱 Next Steps:")
-    print("1. Start server: python -m http.server 8000")
+    print("1. Start server: python deployment/static_server.py")
     print("2. Open http://localhost:8000")
     print("3. Click 'Connect Wallet'")
     print("4. Scan QR code with Pera Wallet")
@@ -10,6 +10,9 @@ import subprocess
 import sys
 from pathlib import Path
 
+from build_frontend import build_frontend
+from static_server import run_server
+
 def run_command(command, cwd=None):
     """Run a command and return the result"""
     try:
@@ -106,33 +109,10 @@ def update_frontend_config(contract_address, network="testnet"):
     """Update frontend configuration with contract address"""
     print("🔧 Updating frontend configuration...")
     
-    # Update smart-contract.js
-    smart_contract_file = Path("frontend/js/smart-contract.js")
-    if smart_contract_file.exists():
-        with open(smart_contract_file, 'r') as f:
-            content = f.read()
-        
-        # Replace contract address
-        content = content.replace('DEMO_CONTRACT_ADDRESS', contract_address)
-        
-        with open(smart_contract_file, 'w') as f:
-            f.write(content)
-        
-        print("✅ Updated smart-contract.js")
-    
-    # Update app.js
-    app_file = Path("frontend/js/app.js")
-    if app_file.exists():
-        with open(app_file, 'r') as f:
-            content = f.read()
-        
-        # Replace contract address
-        content = content.replace('DEMO_CONTRACT_ADDRESS', contract_address)
-        
-        with open(app_file, 'w') as f:
-            f.write(content)
-        
-        print("✅ Updated app.js")
+    # Build dist/ with the contract address injected instead of patching sources
+    config = json.loads(Path("deployment/platform-config.json").read_text())
+    config["contractAddress"] = contract_address
+    build_frontend(config=config, network=network)
     
     # Create environment file
     env_file = Path("frontend/.env")
@@ -174,12 +154,11 @@ def start_development_server():
         print("❌ Frontend directory not found")
         return False
     
-    print("🚀 Server starting at http://localhost:8000")
     print("📱 QR code will be available for mobile wallet connection")
     print("💰 Platform fees will be collected automatically")
     
-    # Start server (this will block)
-    run_command("python -m http.server 8000", cwd=frontend_dir)
+    # Start server (this will block), serving dist/ when it has been built
+    run_server(port=8000)
 
 def main():
     """Main deployment function"""
@@ -217,7 +196,7 @@ def main():
     if start_server == 'y':
         start_development_server()
     else:
-        print("✅ Deployment complete. Run 'python -m http.server 8000' in frontend directory to start server.")
+        print("✅ Deployment complete. Run 'python deployment/static_server.py' to start server.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Algo Content Hub - Hub Registry Client
+Reads and registers tenant hubs of a HubFactory, and runs shared tooling over all of them
+"""
+
+import os
+import sys
+import base64
+import argparse
+
+from algosdk import abi, account, logic, mnemonic, transaction
+from algosdk.error import IndexerHTTPError
+from algosdk.v2client import algod
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+
+from snapshot import IndexerStore, fetch_state, get_indexer_client
+
+# HubFactory keeps one box per tenant: "hub_" + tenant ID -> HubRecord
+HUB_KEY_PREFIX = b"hub_"
+HUB_RECORD = abi.ABIType.from_string("(uint64,byte[],byte[],uint64)")
+
+CREATE_HUB = abi.Method.from_signature("create_hub(byte[],byte[],byte[],uint64,byte[])uint64")
+
+# create_hub issues up to three inner transactions: app create, initialize_platform
+# and the refund of the funding the factory did not need
+CREATE_HUB_FEE_MULTIPLIER = 4
+
+# Minimum balance the factory takes on per hub, paid by the caller of create_hub
+BOX_BASE_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+# Upper bound for the created hub app: 3 extra pages and all 64 global slots as
+# byte slices. The factory refunds whatever is above its new minimum balance.
+HUB_APP_MIN_BALANCE = 100_000 * 4 + 50_000 * 64
+
+
+def hub_box_name(tenant_id):
+    """Box name of a tenant's registry entry"""
+    return HUB_KEY_PREFIX + tenant_id.encode()
+
+
+def hub_funding(tenant_id, platform_name, platform_owner, platform_fee):
+    """Microalgos the factory needs for a new hub's box and app"""
+    record = HUB_RECORD.encode([0, platform_name.encode(), platform_owner.encode(), platform_fee])
+    box_size = len(hub_box_name(tenant_id)) + len(record)
+    return BOX_BASE_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * box_size + HUB_APP_MIN_BALANCE
+
+
+def get_algod_client():
+    """Create an algod client from the environment"""
+    url = os.environ.get("ALGOD_URL", "https://mainnet-api.algonode.cloud")
+    token = os.environ.get("ALGOD_TOKEN", "")
+    return algod.AlgodClient(token, url)
+
+
+class Tenant:
+    """A hub registered with the factory"""
+
+    def __init__(self, tenant_id, app_id, platform_name="", platform_owner="", platform_fee=0):
+        self.tenant_id = tenant_id
+        self.app_id = app_id
+        self.platform_name = platform_name
+        self.platform_owner = platform_owner
+        self.platform_fee = platform_fee
+
+    def __repr__(self):
+        return f"Tenant({self.tenant_id!r}, app_id={self.app_id})"
+
+
+class RegistryClient:
+    """Client for the HubFactory tenant registry"""
+
+    def __init__(self, factory_app_id, indexer_client=None, algod_client=None):
+        self.factory_app_id = factory_app_id
+        self.indexer_client = indexer_client or get_indexer_client()
+        self.algod_client = algod_client
+
+    def box_names(self):
+        """Yield the names of all registry boxes of the factory"""
+        next_page = None
+        while True:
+            response = self.indexer_client.application_boxes(self.factory_app_id, next_page=next_page)
+            for box in response.get("boxes", []):
+                yield base64.b64decode(box["name"])
+            next_page = response.get("next-token")
+            if not next_page:
+                break
+
+    def read_tenant(self, box_name):
+        """Decode one registry box into a Tenant"""
+        response = self.indexer_client.application_box_by_name(self.factory_app_id, box_name)
+        app_id, platform_name, platform_owner, platform_fee = HUB_RECORD.decode(base64.b64decode(response["value"]))
+        return Tenant(
+            box_name[len(HUB_KEY_PREFIX):].decode("utf-8", errors="replace"),
+            app_id,
+            bytes(platform_name).decode("utf-8", errors="replace"),
+            bytes(platform_owner).decode("utf-8", errors="replace"),
+            platform_fee,
+        )
+
+    def tenants(self):
+        """Return all registered tenants, ordered by tenant ID"""
+        box_names = sorted(name for name in self.box_names() if name.startswith(HUB_KEY_PREFIX))
+        return [self.read_tenant(name) for name in box_names]
+
+    def get(self, tenant_id):
+        """Return one tenant, or None if it is not registered"""
+        try:
+            return self.read_tenant(hub_box_name(tenant_id))
+        except IndexerHTTPError:
+            return None
+
+    def create_hub(self, sender, signer, tenant_id, platform_name, platform_version,
+                   platform_fee, platform_owner):
+        """Deploy a hub for a tenant through the factory and return its app ID
+
+        The call is grouped with a payment that covers the minimum balance the
+        factory takes on for the tenant's box and the new hub app; the factory
+        refunds the part of it that the hub did not need.
+        """
+        algod_client = self.algod_client or get_algod_client()
+        payment = transaction.PaymentTxn(
+            sender,
+            algod_client.suggested_params(),
+            logic.get_application_address(self.factory_app_id),
+            hub_funding(tenant_id, platform_name, platform_owner, platform_fee),
+        )
+        params = algod_client.suggested_params()
+        params.flat_fee = True
+        params.fee = params.min_fee * CREATE_HUB_FEE_MULTIPLIER
+
+        composer = AtomicTransactionComposer()
+        composer.add_transaction(TransactionWithSigner(payment, signer))
+        composer.add_method_call(
+            app_id=self.factory_app_id,
+            method=CREATE_HUB,
+            sender=sender,
+            sp=params,
+            signer=signer,
+            method_args=[
+                tenant_id.encode(),
+                platform_name.encode(),
+                platform_version.encode(),
+                platform_fee,
+                platform_owner.encode(),
+            ],
+            boxes=[(self.factory_app_id, hub_box_name(tenant_id))],
+        )
+        result = composer.execute(algod_client, 4)
+        return result.abi_results[0].return_value
+
+
+def signer_from_environment():
+    """Load the deployer account from DEPLOYER_MNEMONIC"""
+    phrase = os.environ.get("DEPLOYER_MNEMONIC")
+    if not phrase:
+        return None, None
+    private_key = mnemonic.to_private_key(phrase)
+    return account.address_from_private_key(private_key), AccountTransactionSigner(private_key)
+
+
+def register_tenants(registry, tenant_configs, defaults):
+    """Create hubs for configured tenants that are not registered yet
+
+    Hubs created here are returned from create_hub's result rather than
+    re-read from the indexer, which may not have caught up with them yet.
+    """
+    sender, signer = signer_from_environment()
+    registered = {tenant.tenant_id: tenant for tenant in registry.tenants()}
+
+    for tenant_config in tenant_configs:
+        tenant_id = tenant_config["tenantId"]
+        if tenant_id in registered:
+            print(f"✅ {tenant_id}: app {registered[tenant_id].app_id}")
+            continue
+        if signer is None:
+            print(f"❌ {tenant_id}: not registered and DEPLOYER_MNEMONIC is not set")
+            continue
+        platform_name = tenant_config.get("platformName", defaults["platformName"])
+        platform_fee = tenant_config.get("platformFee", defaults["platformFee"])
+        platform_owner = tenant_config.get("platformOwner", defaults["platformOwner"])
+        app_id = registry.create_hub(
+            sender,
+            signer,
+            tenant_id,
+            platform_name,
+            tenant_config.get("platformVersion", defaults["platformVersion"]),
+            platform_fee,
+            platform_owner,
+        )
+        registered[tenant_id] = Tenant(tenant_id, app_id, platform_name, platform_owner, platform_fee)
+        print(f"✅ {tenant_id}: deployed app {app_id}")
+
+    return [registered[tenant_id] for tenant_id in sorted(registered)]
+
+
+def sync_tenants(registry, db_path, tenants=None):
+    """Bootstrap and catch up every tenant's indexer state in one database"""
+    tenants = tenants if tenants is not None else registry.tenants()
+    conn = IndexerStore.connect(db_path)
+    try:
+        for tenant in tenants:
+            store = IndexerStore(db_path, tenant.tenant_id, conn)
+            if store.get_meta("app_id") is None:
+                snapshot_round, columns = fetch_state(tenant.app_id, client=registry.indexer_client)
+                store.load_columns(tenant.app_id, snapshot_round, columns)
+            store.catch_up(registry.indexer_client)
+    finally:
+        conn.close()
+
+
+def main():
+    """Registry entry point"""
+    parser = argparse.ArgumentParser(description="Algo Content Hub tenant registry")
+    parser.add_argument("factory_app_id", type=int)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List registered tenants")
+
+    sync_cmd = commands.add_parser("sync", help="Catch up the indexer store of every tenant")
+    sync_cmd.add_argument("db")
+
+    args = parser.parse_args()
+
+    print("🎬 Algo Content Hub - Hub Registry")
+    print("=" * 50)
+
+    registry = RegistryClient(args.factory_app_id)
+    if args.command == "list":
+        tenants = registry.tenants()
+        if not tenants:
+            print("❌ No tenants registered")
+            sys.exit(1)
+        for tenant in tenants:
+            print(f"🏷️  {tenant.tenant_id}: app {tenant.app_id}, {tenant.platform_name}, "
+                  f"fee {tenant.platform_fee}%, owner {tenant.platform_owner}")
+    elif args.command == "sync":
+        sync_tenants(registry, args.db)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Algo Content Hub - State Snapshot Tool
+Exports full contract state at a round to Parquet and bootstraps the indexer store from it
+"""
+
+import os
+import sys
+import base64
+import sqlite3
+import argparse
+from pathlib import Path
+from itertools import repeat
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from algosdk.v2client import indexer
+
+# Global state layout of AlgoContentHub: field name -> value type.
+# Scalars are stored under their field name, map entries under field name + map key.
+STATE_SCALARS = {
+    "platform_fee": "uint",
+    "total_revenue": "uint",
+    "platform_name": "bytes",
+    "platform_version": "bytes",
+    "platform_owner": "bytes",
+    "total_content": "uint",
+    "total_users": "uint",
+}
+
+STATE_MAPS = {
+    # Content registry
+    "content_hashes": "bytes",
+    "content_owners": "bytes",
+    "content_prices": "uint",
+    "content_types": "bytes",
+    "content_metadata": "bytes",
+    # Access control
+    "view_permissions": "bytes",
+    "view_sessions": "uint",
+    "ownership_tokens": "uint",
+    # Revenue management
+    "creator_revenue": "uint",
+    "payment_history": "uint",
+    # Content verification
+    "verified_content": "bytes",
+    "content_registry": "bytes",
+    # NFT ownership
+    "nft_metadata": "bytes",
+    "nft_owners": "bytes",
+    "nft_created": "bytes",
+}
+
+# Maps grouped by the entity they describe, used to pivot snapshots into wide frames
+STATE_ENTITIES = {
+    "content": [
+        "content_hashes", "content_owners", "content_prices", "content_types",
+        "content_metadata", "ownership_tokens", "verified_content",
+        "content_registry", "creator_revenue",
+    ],
+    "sessions": ["view_permissions", "view_sessions"],
+    "nft": ["nft_metadata", "nft_owners", "nft_created"],
+    "payments": ["payment_history"],
+}
+
+# Longest prefix first so a map name never shadows a longer one
+_MAP_PREFIXES = sorted(STATE_MAPS, key=len, reverse=True)
+
+SNAPSHOT_SCHEMA = pa.schema([
+    ("field", pa.dictionary(pa.int16(), pa.string())),
+    ("key", pa.binary()),
+    ("bytes_value", pa.binary()),
+    ("uint_value", pa.uint64()),
+])
+
+# Namespace used when a deployment runs a single hub
+DEFAULT_TENANT = "default"
+
+# Indexer global-state-delta actions
+DELTA_SET_BYTES = 1
+DELTA_SET_UINT = 2
+DELTA_DELETE = 3
+
+
+def get_indexer_client():
+    """Create an indexer client from the environment"""
+    url = os.environ.get("INDEXER_URL", "https://mainnet-idx.algonode.cloud")
+    token = os.environ.get("INDEXER_TOKEN", "")
+    return indexer.IndexerClient(token, url)
+
+
+def split_state_key(raw_key, scalars=STATE_SCALARS, map_prefixes=_MAP_PREFIXES):
+    """Split a raw global state key into (field, map key)"""
+    name = raw_key.decode("utf-8", errors="replace")
+    if name in scalars:
+        return name, b""
+    for prefix in map_prefixes:
+        if raw_key.startswith(prefix.encode()):
+            return prefix, raw_key[len(prefix):]
+    return None, raw_key
+
+
+def decode_state_value(value):
+    """Decode an indexer TealValue into (bytes_value, uint_value)"""
+    # TealValue type 1 is bytes, 2 is uint
+    if value.get("type") == 1:
+        return base64.b64decode(value.get("bytes", "")), None
+    return None, value.get("uint", 0)
+
+
+def decode_global_state(global_state, scalars=STATE_SCALARS, map_prefixes=_MAP_PREFIXES):
+    """Decode an application's global-state list into snapshot columns"""
+    columns = {"field": [], "key": [], "bytes_value": [], "uint_value": []}
+    for entry in global_state:
+        field, key = split_state_key(base64.b64decode(entry["key"]), scalars, map_prefixes)
+        if field is None:
+            continue
+        bytes_value, uint_value = decode_state_value(entry["value"])
+        columns["field"].append(field)
+        columns["key"].append(key)
+        columns["bytes_value"].append(bytes_value)
+        columns["uint_value"].append(uint_value)
+    return columns
+
+
+def app_calls(txn, app_id):
+    """Yield the transaction and its inner transactions that call app_id, in execution order
+
+    Searching by application ID also returns root transactions of other apps
+    that call app_id internally (HubFactory.create_hub calling a new hub's
+    initialize_platform), whose own global-state-delta is not app_id's.
+    """
+    app_txn = txn.get("application-transaction", {})
+    if (app_txn.get("application-id") or txn.get("created-application-index")) == app_id:
+        yield txn
+    for inner in txn.get("inner-txns", []):
+        yield from app_calls(inner, app_id)
+
+
+def fetch_state(app_id, client=None):
+    """Fetch the current global state of the app with the round it was read at"""
+    client = client or get_indexer_client()
+    # The indexer only serves current state; historical round_num lookups are unsupported
+    response = client.applications(app_id)
+    snapshot_round = response["current-round"]
+    params = response["application"]["params"]
+    return snapshot_round, decode_global_state(params.get("global-state", []))
+
+
+def export_snapshot(app_id, output_path, client=None):
+    """Write a consistent state snapshot of the app to a Parquet file"""
+    print(f"📸 Taking snapshot of app {app_id}...")
+    snapshot_round, columns = fetch_state(app_id, client)
+
+    table = pa.Table.from_pydict(columns, schema=SNAPSHOT_SCHEMA)
+    table = table.replace_schema_metadata({
+        b"app_id": str(app_id).encode(),
+        b"round": str(snapshot_round).encode(),
+    })
+    pq.write_table(table, output_path, compression="zstd")
+
+    print(f"✅ Snapshot written: {output_path}")
+    print(f"📍 Round: {snapshot_round}, entries: {table.num_rows}")
+    return snapshot_round
+
+
+def read_snapshot(path):
+    """Read a snapshot file, returning (app_id, round, table)"""
+    table = pq.read_table(path)
+    metadata = table.schema.metadata or {}
+    return int(metadata[b"app_id"]), int(metadata[b"round"]), table
+
+
+def snapshot_frames(path):
+    """Pivot a snapshot into one wide DataFrame per entity, indexed by map key"""
+    _, _, table = read_snapshot(path)
+    # Keep uint64 values as exact Python ints rather than nullable floats
+    frame = table.to_pandas(integer_object_nulls=True)
+    frame["field"] = frame["field"].astype(str)
+    frame["value"] = frame["bytes_value"].where(frame["bytes_value"].notna(), frame["uint_value"])
+
+    frames = {}
+    for entity, fields in STATE_ENTITIES.items():
+        rows = frame[frame["field"].isin(fields)]
+        wide = rows.pivot(index="key", columns="field", values="value")
+        frames[entity] = wide.reindex(columns=fields)
+    scalars = frame[frame["field"].isin(list(STATE_SCALARS))]
+    frames["platform"] = scalars.set_index("field")["value"]
+    return frames
+
+
+class IndexerStore:
+    """SQLite-backed store of decoded contract state used by the API nodes
+
+    Every row is namespaced by tenant so the hubs of one deployment can share
+    a database and connection.
+    """
+
+    def __init__(self, db_path, tenant=DEFAULT_TENANT, conn=None):
+        self.db_path = Path(db_path)
+        self.tenant = tenant
+        self.conn = conn or self.connect(db_path)
+
+    @staticmethod
+    def connect(db_path):
+        """Open a store database, creating its tables if needed"""
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS state (
+                tenant TEXT NOT NULL,
+                field TEXT NOT NULL,
+                key BLOB NOT NULL,
+                bytes_value BLOB,
+                uint_value INTEGER,
+                PRIMARY KEY (tenant, field, key)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS meta (
+                tenant TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (tenant, name)
+            );
+        """)
+        return conn
+
+    def get_meta(self, name, default=None):
+        """Read a metadata value"""
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE tenant = ? AND name = ?", (self.tenant, name)
+        ).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, name, value):
+        """Write a metadata value"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (tenant, name, value) VALUES (?, ?, ?)",
+            (self.tenant, name, str(value)),
+        )
+
+    @property
+    def round(self):
+        """Last round applied to the store"""
+        return int(self.get_meta("round", 0))
+
+    def load_columns(self, app_id, snapshot_round, columns):
+        """Replace the tenant's state with decoded snapshot columns in a single transaction"""
+        # SQLite has no unsigned type, store the uint64 bit pattern as signed
+        uint_values = [
+            None if value is None else value - (1 << 64) if value >= (1 << 63) else value
+            for value in columns["uint_value"]
+        ]
+        rows = zip(
+            repeat(self.tenant), columns["field"], columns["key"], columns["bytes_value"], uint_values
+        )
+
+        with self.conn:
+            self.conn.execute("DELETE FROM state WHERE tenant = ?", (self.tenant,))
+            self.conn.executemany("INSERT INTO state VALUES (?, ?, ?, ?, ?)", rows)
+            self.set_meta("app_id", app_id)
+            self.set_meta("round", snapshot_round)
+
+        print(f"✅ Loaded {len(columns['field'])} entries for {self.tenant} at round {snapshot_round}")
+        return snapshot_round
+
+    def load_snapshot(self, path):
+        """Replace the tenant's state with a snapshot file"""
+        app_id, snapshot_round, table = read_snapshot(path)
+        return self.load_columns(app_id, snapshot_round, table.to_pydict())
+
+    def apply_delta(self, delta):
+        """Apply one global-state-delta list from an indexer transaction"""
+        for entry in delta:
+            field, key = split_state_key(base64.b64decode(entry["key"]))
+            if field is None:
+                continue
+            value = entry["value"]
+            action = value["action"]
+            if action == DELTA_DELETE:
+                self.conn.execute(
+                    "DELETE FROM state WHERE tenant = ? AND field = ? AND key = ?",
+                    (self.tenant, field, key),
+                )
+                continue
+            if action == DELTA_SET_BYTES:
+                row = (self.tenant, field, key, base64.b64decode(value.get("bytes", "")), None)
+            else:
+                uint_value = value.get("uint", 0)
+                if uint_value >= (1 << 63):
+                    uint_value -= 1 << 64
+                row = (self.tenant, field, key, None, uint_value)
+            self.conn.execute("INSERT OR REPLACE INTO state VALUES (?, ?, ?, ?, ?)", row)
+
+    def catch_up(self, client=None, page_size=1000):
+        """Apply every app call after the stored round, resuming incrementally"""
+        client = client or get_indexer_client()
+        app_id = int(self.get_meta("app_id"))
+        start_round = self.round + 1
+        print(f"🔄 Resuming {self.tenant} (app {app_id}) from round {start_round}...")
+
+        applied = 0
+        next_page = None
+        while True:
+            response = client.search_transactions(
+                application_id=app_id,
+                min_round=start_round,
+                limit=page_size,
+                next_page=next_page,
+            )
+            transactions = response.get("transactions", [])
+            next_page = response.get("next-token")
+            with self.conn:
+                for txn in transactions:
+                    for call in app_calls(txn, app_id):
+                        self.apply_delta(call.get("global-state-delta", []))
+                if transactions:
+                    # A page can end mid-round, so only checkpoint rounds known to be
+                    # complete; deltas hold absolute values, so replaying the trailing
+                    # round after a restart is safe.
+                    last_round = transactions[-1]["confirmed-round"]
+                    self.set_meta("round", max(self.round, last_round - 1 if next_page else last_round))
+                applied += len(transactions)
+            if not transactions or not next_page:
+                break
+
+        with self.conn:
+            self.set_meta("round", max(self.round, response.get("current-round", 0)))
+
+        print(f"✅ Applied {applied} transactions, {self.tenant} at round {self.round}")
+        return self.round
+
+    def close(self):
+        """Close the underlying connection"""
+        self.conn.close()
+
+
+def main():
+    """Snapshot tool entry point"""
+    parser = argparse.ArgumentParser(description="Algo Content Hub state snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = commands.add_parser("export", help="Export contract state to Parquet")
+    export_cmd.add_argument("app_id", type=int)
+    export_cmd.add_argument("output")
+
+    load_cmd = commands.add_parser("load", help="Bootstrap the indexer store from a snapshot")
+    load_cmd.add_argument("snapshot")
+    load_cmd.add_argument("db")
+    load_cmd.add_argument("--tenant", default=DEFAULT_TENANT)
+    load_cmd.add_argument("--no-resume", action="store_true")
+
+    resume_cmd = commands.add_parser("resume", help="Catch the indexer store up to the chain tip")
+    resume_cmd.add_argument("db")
+    resume_cmd.add_argument("--tenant", default=DEFAULT_TENANT)
+
+    args = parser.parse_args()
+
+    print("🎬 Algo Content Hub - State Snapshot")
+    print("=" * 50)
+
+    if args.command == "export":
+        export_snapshot(args.app_id, args.output)
+        return
+
+    store = IndexerStore(args.db, args.tenant)
+    try:
+        if args.command == "load":
+            if not Path(args.snapshot).exists():
+                print(f"❌ Snapshot not found: {args.snapshot}")
+                sys.exit(1)
+            store.load_snapshot(args.snapshot)
+            if args.no_resume:
+                return
+        elif store.get_meta("app_id") is None:
+            print(f"❌ No snapshot loaded for tenant {args.tenant} in {args.db}")
+            sys.exit(1)
+        store.catch_up()
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
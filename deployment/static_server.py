@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Algo Content Hub - Static Server
+Asyncio HTTP/1.1 server for the built frontend and cached media
+"""
+
+import os
+import sys
+import json
+import signal
+import traceback
+import asyncio
+import argparse
+import mimetypes
+from pathlib import Path
+from email.utils import formatdate
+from urllib.parse import unquote, urlsplit
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Subdirectory of a build that build_frontend.py --tenants writes tenant builds to
+TENANTS_DIR = "tenants"
+
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "no-cache"
+
+# Precompressed sidecars in order of preference
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+KEEPALIVE_TIMEOUT = 15
+MAX_HEADER_SIZE = 16 * 1024
+MAX_KEEPALIVE_REQUESTS = 1000
+
+STATUS_TEXT = {
+    200: "OK",
+    206: "Partial Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    416: "Range Not Satisfiable",
+    500: "Internal Server Error",
+}
+
+
+class StaticFile:
+    """Resolved file with the headers that do not depend on the request"""
+
+    def __init__(self, path, etag, cache_control, content_type, variants):
+        self.path = path
+        self.etag = etag
+        self.cache_control = cache_control
+        self.content_type = content_type
+        self.variants = variants  # encoding -> (path, size, etag)
+        stat = path.stat()
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+
+def parse_range(header, size):
+    """Parse a single-range Range header into (start, end), None to ignore, or False if unsatisfiable"""
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    start, _, end = spec.strip().partition("-")
+    # isdigit() also rejects signs, so "bytes=--5" is ignored rather than read as a negative length
+    if not (start + end).isdigit():
+        return None
+    if not start:
+        length = int(end)
+        if length == 0 or size == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size:
+        return False
+    if end < start:
+        return None
+    return start, end
+
+
+def accepted_encodings(header):
+    """Return the set of content codings the client accepts"""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class Site:
+    """Static tree and media directory served for one host"""
+
+    def __init__(self, root, media_root=None, excluded=()):
+        self.root = Path(root).resolve()
+        self.media_root = Path(media_root).resolve() if media_root else None
+        self.excluded = [Path(path).resolve() for path in excluded]
+        self.manifest = {}
+        self.manifest_mtime = None
+        self.refresh_manifest()
+
+    def refresh_manifest(self):
+        """Reload the build manifest written by build_frontend.py when it changes
+
+        Returns True if the manifest was reloaded, so cached ETags are stale.
+        """
+        manifest_path = self.root / "manifest.json"
+        try:
+            mtime = manifest_path.stat().st_mtime_ns
+            if mtime == self.manifest_mtime:
+                return False
+            manifest = json.loads(manifest_path.read_text()).get("files", {})
+        except (OSError, ValueError):
+            # Missing, or caught mid-rebuild; fall back to stat-based ETags
+            mtime, manifest = None, {}
+            if self.manifest_mtime is None and not self.manifest:
+                return False
+        self.manifest, self.manifest_mtime = manifest, mtime
+        return True
+
+
+class StaticServer:
+    """Serves static trees with precompressed variants, ETags and byte ranges
+
+    Requests are routed to a tenant's site by Host header, falling back to the
+    default site; file metadata is cached per resolved path, so tenants never
+    share entries. With tenant sites the default site gets no media and never
+    serves the tenant builds, since any unmatched Host (a bare IP) lands on it.
+    """
+
+    def __init__(self, root, media_root=None, media_prefix="/media/", sites=None):
+        root = Path(root)
+        if sites:
+            excluded = [root / TENANTS_DIR] + [site.root for site in sites.values()]
+            self.default_site = Site(root, None, excluded)
+        else:
+            self.default_site = Site(root, media_root, [root / TENANTS_DIR])
+        self.sites = {host.lower(): site for host, site in (sites or {}).items()}
+        self.media_prefix = media_prefix
+        self.files = {}
+
+    def site_for(self, host):
+        """Return the site serving a Host header value"""
+        return self.sites.get(host.rsplit(":", 1)[0].lower(), self.default_site)
+
+    def resolve(self, url_path, site):
+        """Map a URL path to a file inside the site's roots, or None"""
+        root = site.root
+        rel_path = url_path.lstrip("/")
+        if site.media_root and url_path.startswith(self.media_prefix):
+            root = site.media_root
+            rel_path = url_path[len(self.media_prefix):]
+        if not rel_path or rel_path.endswith("/"):
+            rel_path += "index.html"
+
+        path = (root / rel_path).resolve()
+        if root not in path.parents or not path.is_file():
+            return None
+        if any(excluded == path or excluded in path.parents for excluded in site.excluded):
+            return None
+        return path
+
+    def lookup(self, url_path, site=None):
+        """Return the StaticFile for a URL path, using the cached entry while unchanged"""
+        site = site or self.default_site
+        if site.refresh_manifest():
+            self.files = {path: entry for path, entry in self.files.items() if site.root not in path.parents}
+        path = self.resolve(url_path, site)
+        if path is None:
+            return None
+
+        cached = self.files.get(path)
+        if cached is not None and cached.mtime == path.stat().st_mtime:
+            return cached
+
+        entry = site.manifest.get(path.relative_to(site.root).as_posix()) if site.root in path.parents else None
+        if entry:
+            etag = f'"{entry["etag"]}"'
+            cache_control = entry["cache_control"]
+        else:
+            stat = path.stat()
+            etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+            cache_control = CACHE_REVALIDATE
+
+        variants = {}
+        for encoding, suffix in ENCODINGS:
+            variant = path.with_name(path.name + suffix)
+            if variant.is_file():
+                variants[encoding] = (variant, variant.stat().st_size, f'{etag[:-1]}-{suffix[1:]}"')
+
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+
+        static_file = StaticFile(path, etag, cache_control, content_type, variants)
+        self.files[path] = static_file
+        return static_file
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until it closes or idles out"""
+        try:
+            for _ in range(MAX_KEEPALIVE_REQUESTS):
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError):
+                    break
+                try:
+                    keep_alive = await self.handle_request(head, writer)
+                except (ConnectionError, OSError):
+                    raise
+                except Exception:
+                    # Anything escaping handle_request happened before a head was sent
+                    traceback.print_exc()
+                    await self.send_error(writer, 500, keep_alive=False)
+                    break
+                if not keep_alive:
+                    break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, head, writer):
+        """Serve one request, returning whether the connection stays open"""
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            await self.send_error(writer, 400, keep_alive=False)
+            return False
+
+        headers = {}
+        has_body = False
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                name, value = name.strip().lower(), value.strip()
+                headers[name] = value
+                if name == "transfer-encoding" or (name == "content-length" and value != "0"):
+                    has_body = True
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        # Request bodies are never read, so close instead of parsing one as the next request
+        if has_body or method not in ("GET", "HEAD"):
+            keep_alive = False
+
+        if method not in ("GET", "HEAD"):
+            await self.send_error(writer, 405, keep_alive, {"Allow": "GET, HEAD"})
+            return keep_alive
+
+        static_file = self.lookup(unquote(urlsplit(target).path), self.site_for(headers.get("host", "")))
+        if static_file is None:
+            await self.send_error(writer, 404, keep_alive)
+            return keep_alive
+
+        response_headers = {
+            "Cache-Control": static_file.cache_control,
+            "Last-Modified": static_file.last_modified,
+            "Accept-Ranges": "bytes",
+            "Vary": "Accept-Encoding",
+        }
+        if keep_alive:
+            response_headers["Keep-Alive"] = f"timeout={KEEPALIVE_TIMEOUT}"
+
+        # Byte ranges are served from the identity encoding only
+        range_header = headers.get("range")
+        if range_header and "if-range" in headers and headers["if-range"] != static_file.etag:
+            range_header = None
+
+        path, size, etag = static_file.path, static_file.size, static_file.etag
+        if not range_header:
+            accepted = accepted_encodings(headers.get("accept-encoding", ""))
+            for encoding, _ in ENCODINGS:
+                if encoding in accepted and encoding in static_file.variants:
+                    path, size, etag = static_file.variants[encoding]
+                    response_headers["Content-Encoding"] = encoding
+                    break
+        response_headers["ETag"] = etag
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and (if_none_match == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]):
+            await self.send_head(writer, 304, response_headers, keep_alive)
+            return keep_alive
+
+        status, offset, count = 200, 0, size
+        if range_header:
+            byte_range = parse_range(range_header, size)
+            if byte_range is False:
+                response_headers["Content-Range"] = f"bytes */{size}"
+                await self.send_error(writer, 416, keep_alive, response_headers)
+                return keep_alive
+            if byte_range is not None:
+                start, end = byte_range
+                status, offset, count = 206, start, end - start + 1
+                response_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        response_headers["Content-Type"] = static_file.content_type
+        response_headers["Content-Length"] = str(count)
+        await self.send_head(writer, status, response_headers, keep_alive)
+
+        if method == "GET" and count:
+            try:
+                with open(path, "rb") as f:
+                    # Zero-copy os.sendfile where the transport supports it
+                    await asyncio.get_running_loop().sendfile(writer.transport, f, offset, count)
+            except (ConnectionError, OSError):
+                raise
+            except Exception:
+                # The head is already out, so the only safe answer is to drop the connection
+                traceback.print_exc()
+                return False
+        return keep_alive
+
+    async def send_head(self, writer, status, headers, keep_alive):
+        """Write the status line and headers"""
+        lines = [f"HTTP/1.1 {status} {STATUS_TEXT[status]}", f"Date: {formatdate(usegmt=True)}", "Server: AlgoContentHub"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+    async def send_error(self, writer, status, keep_alive, headers=None):
+        """Write a short plain-text error response"""
+        body = f"{status} {STATUS_TEXT[status]}\n".encode()
+        error_headers = dict(headers or {})
+        error_headers.update({"Content-Type": "text/plain; charset=utf-8", "Content-Length": str(len(body))})
+        await self.send_head(writer, status, error_headers, keep_alive)
+        writer.write(body)
+        await writer.drain()
+
+
+async def serve(root, host="0.0.0.0", port=8000, media_root=None, reuse_port=False, sites=None):
+    """Run the server until cancelled"""
+    server = StaticServer(root, media_root, sites=sites)
+    listener = await asyncio.start_server(
+        server.handle_connection, host, port, limit=MAX_HEADER_SIZE, reuse_port=reuse_port, backlog=1024
+    )
+    async with listener:
+        await listener.serve_forever()
+
+
+def default_root():
+    """Serve the built dist/ tree, falling back to the raw frontend sources"""
+    dist_dir = ROOT_DIR / "dist"
+    return dist_dir if (dist_dir / "index.html").exists() else ROOT_DIR / "frontend"
+
+
+def tenant_sites(config, tenants_dir, media_root=None):
+    """Map every tenant domain to its built tree and media namespace"""
+    sites = {}
+    for tenant in config.get("tenants", []):
+        tenant_id = tenant["tenantId"]
+        tenant_root = Path(tenants_dir) / tenant_id
+        if not tenant_root.is_dir():
+            print(f"⚠️  No build for tenant {tenant_id} in {tenants_dir}")
+            continue
+        tenant_media = Path(media_root) / tenant_id if media_root else None
+        site = Site(tenant_root, tenant_media)
+        for domain in tenant.get("domains", []):
+            sites[domain] = site
+    return sites
+
+
+def run_server(root=None, host="0.0.0.0", port=8000, media_root=None, workers=1, sites=None):
+    """Start the server, forking extra workers that share the port on POSIX"""
+    root = Path(root or default_root())
+    print(f"🚀 Serving {root} at http://localhost:{port}")
+    if media_root:
+        print(f"🎞️  Media from {media_root} at /media/")
+        if sites:
+            print("🎞️  Tenant domains get /media/<tenantId>/, the default site gets no media")
+    for domain, site in (sites or {}).items():
+        print(f"🏷️  {domain} -> {site.root}")
+
+    # PIDs of the workers forked by this process; SIGTERM/SIGINT in the parent stops and reaps them
+    children = []
+    reuse_port = workers > 1 and hasattr(os, "fork")
+    if reuse_port:
+        for _ in range(workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                children = []
+                break
+            children.append(pid)
+        print(f"👷 Worker {os.getpid()} started")
+    elif workers > 1:
+        print("⚠️  Multiple workers need fork(), running a single worker")
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        asyncio.run(serve(root, host, port, media_root, reuse_port, sites))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_workers(children)
+
+
+def stop_workers(children, signum=signal.SIGTERM):
+    """Signal forked workers and reap them so none are left orphaned"""
+    for pid in children:
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+    for pid in children:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+    children.clear()
+
+
+def main():
+    """Static server entry point"""
+    parser = argparse.ArgumentParser(description="Serve the Algo Content Hub frontend")
+    parser.add_argument("--root", help="Directory to serve (default: dist/, else frontend/)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--media", help="Directory of cached media served under /media/ (per tenant with --tenants-dir)")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--tenants-dir", help="Tenant builds from build_frontend.py --tenants, routed by domain")
+    parser.add_argument("--config", default=str(ROOT_DIR / "deployment" / "platform-config.json"))
+    args = parser.parse_args()
+
+    print("🎬 Algo Content Hub - Static Server")
+    print("=" * 50)
+    sites = None
+    if args.tenants_dir:
+        sites = tenant_sites(json.loads(Path(args.config).read_text()), args.tenants_dir, args.media)
+    run_server(args.root, args.host, args.port, args.media, args.workers, sites)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Tests for the JavaScript minifier of build_frontend.py"""
+
+import pytest
+
+from build_frontend import inject_config, minify_js
+
+
+@pytest.mark.parametrize("source", [
+    "const half = total / 2 / count;",
+    "const mean = (a + b) / 2;",
+    "const ratio = values[0] / values[1];",
+    "const x = a++ / 2;",
+    "const y = this.fee / 100;",
+])
+def test_division_is_kept(source):
+    assert minify_js(source) == source + "\n"
+
+
+@pytest.mark.parametrize("source", [
+    "return /a\\/b/g.test(s);",
+    "const valid = typeof s === 'string' && /^[A-Z2-7]{58}$/.test(s);",
+    "if (!/\\/\\*[^/]*\\*\\//.test(s)) throw new Error('x');",
+    "const parts = s.split(/[/,]/);",
+    "case /x/.source: break;",
+])
+def test_regex_literals_are_copied_verbatim(source):
+    assert minify_js(source) == source + "\n"
+
+
+def test_regex_after_keyword_is_not_a_comment():
+    source = "function f(s) {\n    return /\\/\\/x/.test(s); // trailing\n}"
+    assert minify_js(source) == "function f(s) {\nreturn /\\/\\/x/.test(s);\n}\n"
+
+
+@pytest.mark.parametrize("source", [
+    "const url = `${base}/api/${path}`;",
+    "const s = `a ${ { b: '}' }.b } // not a comment`;",
+    "const s = `outer ${ `inner ${x}` } /* kept */`;",
+    "const s = `line one\n    line two`;",
+])
+def test_template_literals_are_copied_verbatim(source):
+    assert minify_js(source) == source + "\n"
+
+
+@pytest.mark.parametrize("source", [
+    "const url = 'https://example.com/path';",
+    'const note = "/* not a comment */";',
+    "const quote = 'it\\'s // fine';",
+])
+def test_comment_markers_inside_strings_are_kept(source):
+    assert minify_js(source) == source + "\n"
+
+
+def test_comments_and_indentation_are_stripped():
+    source = "/* header */\nfunction f() {\n    // body\n    return 1; /* inline */\n}\n"
+    assert minify_js(source) == "function f() {\nreturn 1;\n}\n"
+
+
+def test_newlines_are_kept_for_semicolon_insertion():
+    source = "let a = b\n(c || d).run()\nreturn\nvalue"
+    assert minify_js(source).splitlines() == ["let a = b", "(c || d).run()", "return", "value"]
+
+
+def test_network_is_injected_only_when_given():
+    source = "this.config = {\n    network: 'testnet'\n};"
+    config = {"network": "mainnet", "contractAddress": "TO_BE_DEPLOYED", "platformFee": 2}
+    assert '"network"' not in inject_config(source, config)
+    assert '"contractAddress"' not in inject_config(source, config)
+    assert '"network": "testnet"' in inject_config(source, config, network="testnet")
@@ -0,0 +1,134 @@
+from algopy import ARC4Contract, BoxMap, Global, GlobalStateUint64, GlobalStateBytes, Txn, UInt64, Bytes, abimethod, arc4, compile_contract, itxn
+
+from AlgoContentHub import AlgoContentHub
+
+# Box key is prefix + tenant ID and box keys are limited to 64 bytes
+HUB_KEY_PREFIX = b"hub_"
+MAX_TENANT_ID_LENGTH = 60
+
+
+class HubRecord(arc4.Struct):
+    """Registry entry for one tenant hub"""
+    app_id: arc4.UInt64
+    platform_name: arc4.DynamicBytes
+    platform_owner: arc4.DynamicBytes
+    platform_fee: arc4.UInt64
+
+
+class HubFactory(ARC4Contract):
+    """
+    Hub Factory - Deploys and tracks AlgoContentHub instances
+    Handles: Tenant registry, hub deployment, hub initialization
+    """
+
+    def __init__(self):
+        # Tenant registry, one box per tenant so it is not bound by the 64 global keys
+        self.hubs = BoxMap(Bytes, HubRecord, key_prefix=HUB_KEY_PREFIX)  # Tenant ID -> Hub record
+
+        # Factory settings
+        self.factory_owner = GlobalStateBytes()  # Factory owner wallet address
+        self.hub_count = GlobalStateUint64()  # Total hub count
+
+    @abimethod()
+    def initialize_factory(self, factory_owner: Bytes):
+        """Initialize the hub factory, once, by its creator"""
+        assert Txn.sender == Global.creator_address
+        assert self.factory_owner == Bytes()
+        assert factory_owner.length == 32
+        self.factory_owner = factory_owner
+        self.hub_count = 0
+
+    @abimethod()
+    def create_hub(
+        self,
+        tenant_id: Bytes,
+        platform_name: Bytes,
+        platform_version: Bytes,
+        platform_fee_percentage: UInt64,
+        platform_owner: Bytes
+    ) -> UInt64:
+        """Deploy and initialize a new AlgoContentHub for a tenant
+
+        The caller groups a payment to the factory that covers the minimum
+        balance of the tenant's box and the new hub app; anything above what
+        the factory needs is refunded.
+        """
+        # Only the factory owner registers tenants, once each
+        assert Txn.sender.bytes == self.factory_owner
+        assert tenant_id.length > 0 and tenant_id.length <= MAX_TENANT_ID_LENGTH
+        assert tenant_id not in self.hubs
+
+        # Deploy child hub and configure it
+        hub_app_id = self.deploy_hub_instance()
+        self.initialize_hub_instance(
+            hub_app_id, platform_name, platform_version, platform_fee_percentage, platform_owner
+        )
+
+        # Record tenant
+        self.hubs[tenant_id] = HubRecord(
+            arc4.UInt64(hub_app_id),
+            arc4.DynamicBytes(platform_name),
+            arc4.DynamicBytes(platform_owner),
+            arc4.UInt64(platform_fee_percentage),
+        )
+        self.hub_count += 1
+        self.refund_excess_balance()
+
+        # Emit hub created event
+        self.emit_hub_created_event(tenant_id, hub_app_id)
+
+        return hub_app_id
+
+    @abimethod()
+    def get_hub(self, tenant_id: Bytes) -> UInt64:
+        """Get the hub app ID for a tenant"""
+        assert tenant_id in self.hubs
+        return self.hubs[tenant_id].app_id.native
+
+    @abimethod()
+    def get_hub_count(self) -> UInt64:
+        """Get the number of deployed hubs"""
+        return self.hub_count
+
+    # Helper functions
+    def deploy_hub_instance(self) -> UInt64:
+        """Deploy an AlgoContentHub instance and return its app ID"""
+        compiled = compile_contract(AlgoContentHub)
+        created = itxn.ApplicationCall(
+            approval_program=compiled.approval_program,
+            clear_state_program=compiled.clear_state_program,
+            global_num_uint=compiled.global_uints,
+            global_num_bytes=compiled.global_bytes,
+            extra_program_pages=compiled.extra_program_pages,
+            fee=0,
+        ).submit()
+        return created.created_app.id
+
+    def initialize_hub_instance(
+        self,
+        hub_app_id: UInt64,
+        platform_name: Bytes,
+        platform_version: Bytes,
+        platform_fee_percentage: UInt64,
+        platform_owner: Bytes
+    ):
+        """Call initialize_platform on a hub instance"""
+        arc4.abi_call(
+            AlgoContentHub.initialize_platform,
+            platform_name,
+            platform_version,
+            platform_fee_percentage,
+            platform_owner,
+            app_id=hub_app_id,
+            fee=0,
+        )
+
+    def refund_excess_balance(self):
+        """Return everything above the factory's minimum balance to the caller"""
+        factory = Global.current_application_address
+        if factory.balance > factory.min_balance:
+            itxn.Payment(receiver=Txn.sender, amount=factory.balance - factory.min_balance, fee=0).submit()
+
+    def emit_hub_created_event(self, tenant_id: Bytes, hub_app_id: UInt64):
+        """Emit hub created event"""
+        pass